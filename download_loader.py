@@ -1,4 +1,3 @@
-import glob
 import os
 #from zipfile import ZipFile
 from datetime import date
@@ -11,18 +10,19 @@ class DownloadExractor():
         self.find_latest_zip_file()
 
     def build_today_folder(self):
-        if not os.path.exists(self.today_folder):
-            os.makedirs(self.today_folder)
+        os.makedirs(self.today_folder, exist_ok=True)
 
     def unzip_file(self):
         #with ZipFile(self.latest_zip_file, 'r') as f:
         #    f.extractall(self.today_folder)
-        check_output(['unzip', self.latest_zip_file, '-d', self.today_folder], stderr=STDOUT)
+        check_output(['unzip', '-q', self.latest_zip_file, '-d', self.today_folder], stderr=STDOUT)
 
     def find_latest_zip_file(self):
         downloads_path = os.path.join("/home", os.getlogin(), "Downloads")
-        zip_files = glob.glob(os.path.join(downloads_path, "*.zip"))
-        self.latest_zip_file = max(zip_files, key = os.path.getctime)
+        with os.scandir(downloads_path) as entries:
+            zip_files = [entry for entry in entries
+                         if entry.name.endswith(".zip") and not entry.name.startswith(".")]
+        self.latest_zip_file = max(zip_files, key = lambda entry: entry.stat().st_ctime).path
 
 class ScriptInitialer():
     def __init__(self, today_folder):
@@ -41,85 +41,93 @@ class ScriptInitialer():
 
     def edit_config(self):
         with open(self.config_file) as file:
-            data = file.readlines()
+            data = file.read()
 
-        for i in range(len(data)):
-            if "<device-id>" in data[i]:
-                data[i] = data[i].replace("<device-id>", self.devices[0])
+        # only fill in the first test bed, up to and including its <camera-id> line
+        end = data.find("<camera-id>")
+        if end == -1:
+            end = len(data)
+        else:
+            end = data.find("\n", end) + 1 or len(data)
 
-            if "<tablet-id>" in data[i]:
-                data[i] = data[i].replace("<tablet-id>", self.devices[1])
-                
-            if "<camera-id>" in data[i]:
-                data[i] = data[i].replace("<camera-id>", "0")
-                break
+        head = data[:end]
+        head = head.replace("<device-id>", self.devices[0])
+        head = head.replace("<tablet-id>", self.devices[1])
+        head = head.replace("<camera-id>", "0")
 
         with open(self.config_file, 'w') as file:
-            file.writelines(data)
+            file.write(head + data[end:])
 
-    def fix_tablet_version_error(self):
+    def tablet_version_fixes(self):
         error_part = "raise AssertionError(TABLET_NOT_ALLOWED_ERROR_MSG)"
-        
-        with open(self.utils_session_py) as file:
-            data = file.read()
-
-        data = data.replace(error_part, 'tablet_name = "gta4lwifi"', 1)
+        return [(error_part, 'tablet_name = "gta4lwifi"', 1)]
 
-        with open(self.utils_session_py, "w") as file:
-            file.writelines(data)
-
-    def fix_filepath_error(self):
+    def filepath_fixes(self):
         replace_1 = "file://mnt"
         replace_2 = "sdcard"
+        return [(replace_1, "", 1), (replace_2, "storage/emulated/0", -1)]
 
-        with open(self.utils_session_py) as file:
-            data = file.read()
-
-        data = data.replace(replace_1, "", 1)
-        data = data.replace(replace_2, "storage/emulated/0")
-
-        with open(self.utils_session_py, "w") as file:
-            file.writelines(data)
-
-    def fix_rotation_error(self):
+    def rotation_fixes(self):
         replace_1 = "elif 'ROTATION_0' in landscape_val:"
         target_1 = "elif 'ROTATION_0' in landscape_val: landscape_val = '0'"
         replace_2 = "  landscape_val = '0'"
         target_2 = "elif 'ROTATION_270' in landscape_val: landscape_val = '3'"
+        return [(replace_1, target_1, 1), (replace_2, target_2, 1)]
 
-        with open(self.base_test_py) as file:
+    def apply_fixes(self, path, replacements):
+        with open(path) as file:
             data = file.read()
 
-        data = data.replace(replace_1, target_1, 1)
-        data = data.replace(replace_2, target_2, 1)
+        for old, new, count in replacements:
+            data = data.replace(old, new, count)
+
+        with open(path, "w") as file:
+            file.write(data)
 
-        with open(self.base_test_py, "w") as file:
-            file.writelines(data)
+    def fix_tablet_version_error(self):
+        self.apply_fixes(self.utils_session_py, self.tablet_version_fixes())
+
+    def fix_filepath_error(self):
+        self.apply_fixes(self.utils_session_py, self.filepath_fixes())
+
+    def fix_rotation_error(self):
+        self.apply_fixes(self.base_test_py, self.rotation_fixes())
+
+    def fix_tangorpro_errors(self):
+        # one read/write per file instead of one per fix
+        fixes = {
+            self.utils_session_py: self.tablet_version_fixes() + self.filepath_fixes(),
+            self.base_test_py: self.rotation_fixes(),
+        }
+        for path, replacements in fixes.items():
+            self.apply_fixes(path, replacements)
 
     def find_devices(self):
-        devices_list_unencoded = subprocess.check_output("adb devices", stderr=subprocess.STDOUT, shell=True)
-        devices_list = str(devices_list_unencoded.decode('utf-8')).strip()
+        devices_list = subprocess.run(["adb", "devices"], capture_output=True, text=True, check=True).stdout.strip()
         devices = devices_list.split("\n")[1:]
         if len(devices) != 2:
             raise ValueError(f'device number is not correct.')
         self.devices = [device.split("\t")[0] for device in devices]
 
-        get_device_name = "adb -s " + self.devices[1] + " shell getprop ro.product.device"
-        tablet_name_unencoded = subprocess.check_output(get_device_name, stderr=subprocess.STDOUT, shell=True)
-        self.tablet_name = str(tablet_name_unencoded.decode('utf-8')).strip()
+        get_device_name = ["adb", "-s", self.devices[1], "shell", "getprop", "ro.product.device"]
+        self.tablet_name = subprocess.run(get_device_name, capture_output=True, text=True, check=True).stdout.strip()
 
     
 class CommandPrinter():
     def __init__(self, today_folder):
         self.today_folder = today_folder
-    def print_command(self, devices):
+
         cd_top = "cd " + os.path.join(self.today_folder, "android-cts-verifier") + ";"
-        install_apk = "adb -s " + devices[0] + " install -r -g CtsVerifier.apk;"
         activate_conda = "conda activate its_env_vic;"
         cd_ITS = "cd CameraITS;"
         source_env = "source build/envsetup.sh;"
         run_test = "python tools/run_all_tests.py;"
-        print(cd_top + install_apk + activate_conda + cd_ITS + source_env + run_test)
+        self._prefix = cd_top
+        self._suffix = activate_conda + cd_ITS + source_env + run_test
+
+    def print_command(self, devices):
+        install_apk = "adb -s " + devices[0] + " install -r -g CtsVerifier.apk;"
+        print(self._prefix + install_apk + self._suffix)
 
 if __name__ == "__main__":
     today_folder = str(date.today())
@@ -143,11 +151,8 @@ if __name__ == "__main__":
 
     # fixing error
     if SI.tablet_name == "tangorpro":
-        SI.fix_tablet_version_error()
-        SI.fix_filepath_error()
+        SI.fix_tangorpro_errors()
         print("Have fixed " + SI.utils_session_py)
-
-        SI.fix_rotation_error()
         print("Have fixed " + SI.base_test_py + "\n")
 
     # print commands for running all its